@@ -1,10 +1,15 @@
-from flask import Flask, jsonify, render_template, redirect
-from sqlalchemy import func, desc, distinct, inspect, MetaData, Table, Column, Integer, String, Float, create_engine
+from flask import Flask, Response, render_template, redirect
+from sqlalchemy import bindparam, event, select, func, desc, distinct, inspect, MetaData, Table, Column, Integer, SmallInteger, String, Float, create_engine
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
 from flask_sqlalchemy import SQLAlchemy
 import os
-import pandas as pd
-import sqlite3
+import functools
+import itertools
+from operator import itemgetter
 import logging
+import orjson
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -14,70 +19,78 @@ logger = logging.getLogger(__name__)
 # Flask Setup
 #################################################
 
+# Debugging and template reloading are only wanted with the dev server (DEV=1,
+# true or yes; any other value, DEV=0 included, leaves them off); in production
+# the app is served by gunicorn, e.g.
+#   gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:8080 app2:app
+DEV_MODE = os.environ.get("DEV", "").lower() in ("1", "true", "yes")
+
 app = Flask(__name__)
-app.config['DEBUG'] = True
-app.config["TEMPLATES_AUTO_RELOAD"] = True
+app.config['DEBUG'] = DEV_MODE
+app.config["TEMPLATES_AUTO_RELOAD"] = DEV_MODE
 
 #################################################
 # Database Setup
 #################################################
 
-# Using SQLite
-app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///olympics.db"
+# Using SQLite; the path is absolute so it matches build_db.py no matter the
+# working directory (Flask-SQLAlchemy would resolve a relative one against
+# the instance folder)
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "olympics.db")
+app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{DB_PATH}"
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+# Keep a pool of long-lived connections so requests don't pay for connect()
+# and the pragmas below on every hit
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+    "poolclass": QueuePool,
+    "pool_size": 10,
+    "max_overflow": 10,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+    "connect_args": {"check_same_thread": False, "timeout": 30}
+}
+
+# WAL lets readers run concurrently; mmap and a larger page cache keep the
+# (small, read-only) database in memory once it has been touched
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY"
+)
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply the SQLite pragmas to every new pooled connection"""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
 
 # Initialize SQLAlchemy with app
 db = SQLAlchemy(app)
 
-# Create the database and tables if they don't exist
-def create_db_from_csv():
-    """Create SQLite database from CSV files if it doesn't exist"""
-    # Check if database already exists
-    if os.path.exists('olympics.db'):
-        logger.info("Database already exists, skipping creation")
-        return
-    
-    try:
-        # Create connection to SQLite database
-        conn = sqlite3.connect('olympics.db')
-        
-        # Load CSV files into pandas DataFrames
-        logger.info("Loading CSV files...")
-        host_country_df = pd.read_csv("data/host_country.csv")
-        summer_olympics_host_df = pd.read_csv("data/Summer_Olympics_Host.csv")
-        summer_athlete_medals_df = pd.read_csv("data/summer_athlete_medals_count.csv")
-        
-        # Write DataFrames to SQLite tables
-        logger.info("Creating database tables...")
-        host_country_df.to_sql('host_country', conn, index=False, if_exists='replace')
-        summer_olympics_host_df.to_sql('summer_olympics_host', conn, index=False, if_exists='replace')
-        summer_athlete_medals_df.to_sql('athletes', conn, index=False, if_exists='replace')
-        
-        conn.close()
-        logger.info("Database created successfully from CSV files")
-    except Exception as e:
-        logger.error(f"Error creating database: {str(e)}")
-        raise
-
-# Create the database from CSV files
-with app.app_context():
-    create_db_from_csv()
+# The database is built ahead of time by build_db.py, so the app (and every
+# worker process) never has to parse the CSV files or import pandas
+if not os.path.exists(DB_PATH):
+    raise RuntimeError(f"{DB_PATH} not found, build it first with: python build_db.py")
 
 # Define the Athletes model
 class Athletes(db.Model):
     __tablename__ = 'athletes'
     
     id = Column(Integer, primary_key=True)
-    Year = Column(Integer)
+    Year = Column(SmallInteger)
     Country = Column(String)
-    Host = Column(Integer)
-    Athletes = Column(Integer)
-    Sports = Column(Integer)
-    Events = Column(Integer)
-    Gold = Column(Integer)
-    Silver = Column(Integer)
-    Bronze = Column(Integer)
-    Medals = Column(Integer)
+    Host = Column(SmallInteger)
+    Athletes = Column(SmallInteger)
+    Sports = Column(SmallInteger)
+    Events = Column(SmallInteger)
+    Gold = Column(SmallInteger)
+    Silver = Column(SmallInteger)
+    Bronze = Column(SmallInteger)
+    Medals = Column(SmallInteger)
     
     def __repr__(self):
         return f'<Athlete {self.Country}>'
@@ -87,7 +100,7 @@ class HostCountry(db.Model):
     __tablename__ = 'host_country'
     
     id = Column(Integer, primary_key=True)
-    Year = Column(Integer)
+    Year = Column(SmallInteger)
     Country = Column(String)
     City = Column(String)
     
@@ -99,7 +112,7 @@ class SummerOlympicsHost(db.Model):
     __tablename__ = 'summer_olympics_host'
     
     id = Column(Integer, primary_key=True)
-    Year = Column(Integer)
+    Year = Column(SmallInteger)
     Host = Column(String)
     
     def __repr__(self):
@@ -109,6 +122,14 @@ class SummerOlympicsHost(db.Model):
 # Flask Routes
 #################################################
 
+def _json_bytes(body):
+    """Wrap an already encoded JSON body in a response"""
+    return Response(body, mimetype="application/json")
+
+def _json(obj):
+    """Serialize obj with orjson and wrap it in a JSON response"""
+    return _json_bytes(orjson.dumps(obj))
+
 @app.route("/index.html")
 def home():
     """Return the homepage."""
@@ -116,7 +137,7 @@ def home():
         return render_template("index1.html")
     except Exception as e:
         logger.error(f"Error loading homepage: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+        return _json({"error": str(e)}), 500
 
 # @app.route("/analysis")
 # def analysis():
@@ -125,7 +146,7 @@ def home():
 #         return render_template("analysis1.html")
 #     except Exception as e:
 #         logger.error(f"Error loading analysis page: {str(e)}")
-#         return jsonify({"error": str(e)}), 500
+#         return _json({"error": str(e)}), 500
 
 @app.route("/")
 def analysis():
@@ -143,7 +164,7 @@ def olympic_facts():
         return render_template("olympic_facts.html")
     except Exception as e:
         logger.error(f"Error loading Olympic facts page: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+        return _json({"error": str(e)}), 500
 
 @app.route("/machine_learning")
 def machine_learning():
@@ -152,13 +173,144 @@ def machine_learning():
         return render_template("machine_learning.html")
     except Exception as e:
         logger.error(f"Error loading machine learning page: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+        return _json({"error": str(e)}), 500
     
 @app.errorhandler(404)
 def page_not_found(e):
     return render_template('404.html'), 404
 
 # API Routes
+# The database never changes once build_db.py has run, so every API
+# payload is encoded once and the resulting bytes are cached per process.
+
+# Response keys for each payload, in the order the columns are selected
+ATHLETE_KEYS = ("year", "country", "athletes", "sports", "events", "gold", "silver", "bronze", "medals")
+MEDAL_KEYS = ("year", "country", "gold", "silver", "bronze", "total_medals")
+MEDAL_KEYS_AFTER_1960 = ("Year", "Nation", "Gold", "Silver", "Bronze", "Medals")
+TOTAL_MEDAL_KEYS = ("year", "country", "total_medals")
+
+# Columns behind ATHLETE_KEYS and TOTAL_MEDAL_KEYS
+ATHLETE_COLUMNS = (
+    Athletes.Year,
+    Athletes.Country,
+    Athletes.Athletes,
+    Athletes.Sports,
+    Athletes.Events,
+    Athletes.Gold,
+    Athletes.Silver,
+    Athletes.Bronze,
+    Athletes.Medals
+)
+TOTAL_MEDAL_COLUMNS = (Athletes.Year, Athletes.Country, Athletes.Medals)
+
+# Columns behind MEDAL_KEYS / MEDAL_KEYS_AFTER_1960, with a base select that
+# each medal query only adds its filter and ordering to
+ATHLETE_MEDAL_COLUMNS = (
+    Athletes.Year,
+    Athletes.Country,
+    Athletes.Gold,
+    Athletes.Silver,
+    Athletes.Bronze,
+    Athletes.Medals
+)
+ATHLETE_MEDALS_SELECT = select(*ATHLETE_MEDAL_COLUMNS)
+
+def _by_country(query):
+    """
+    Return the exact case-insensitive match and substring search variants of
+    query, with the country bound as :country and :pattern respectively
+    """
+    return (
+        query.where(Athletes.Country.collate("NOCASE") == bindparam("country")),
+        query.where(Athletes.Country.ilike(bindparam("pattern")))
+    )
+
+# Country lookups are built once with bound parameters, so every request
+# reuses the same statements (and SQLAlchemy's compiled form of them)
+MEDAL_WINNERS_BY_COUNTRY = _by_country(
+    select(*ATHLETE_COLUMNS).where(Athletes.Medals > 0)
+    .order_by(Athletes.Year, Athletes.Country)
+)
+COUNTRY_MEDALS_BY_COUNTRY = _by_country(ATHLETE_MEDALS_SELECT.order_by(Athletes.Year))
+
+def _country_rows(statements, country_name):
+    """
+    Run a pair of statements from _by_country(), preferring the exact match
+    (served by ix_ath_country) and only falling back to a substring search
+    when no country has that exact name
+    """
+    exact, substring = statements
+    rows = db.session.execute(exact, {"country": country_name}).all()
+    if not rows:
+        rows = db.session.execute(substring, {"pattern": f"%{country_name}%"}).all()
+    return rows
+
+# The two largest payloads are rendered by SQLite itself: each row comes back
+# as a json_object() string and the rows are joined into an array in C, so
+# no per-row dicts or Python-level encoding are involved. The statements are
+# built from the key and column tuples above and compiled to plain SQL once,
+# for use on a raw DB-API cursor.
+def _json_object_select(keys, columns):
+    """Return a select() of one json_object() per row, pairing each key with its column"""
+    return select(func.json_object(*itertools.chain.from_iterable(zip(keys, columns))))
+
+def _compile_sql(query):
+    """Render query as a plain SQLite statement with its values inlined"""
+    return str(query.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}))
+
+ALL_MEDAL_WINNERS_SQL = _compile_sql(
+    _json_object_select(ATHLETE_KEYS, ATHLETE_COLUMNS)
+    .where(Athletes.Medals > 0)
+    .order_by(Athletes.Year, Athletes.Country)
+)
+TOTAL_MEDALS_SQL = _compile_sql(
+    _json_object_select(TOTAL_MEDAL_KEYS, TOTAL_MEDAL_COLUMNS)
+    .where(Athletes.Year >= 1980)
+    .order_by(Athletes.Year, desc(Athletes.Medals))
+)
+FETCH_BATCH_SIZE = 10000
+
+def _rows_json(rows, keys):
+    """Encode result rows as a list of dicts with the given keys"""
+    return orjson.dumps([dict(zip(keys, row)) for row in rows])
+
+def _api_response(api_name, build, *args):
+    """Return the payload from build(*args), or a JSON error if building it fails"""
+    try:
+        return _json_bytes(build(*args))
+    except Exception as e:
+        logger.error(f"Error in {api_name} API: {str(e)}")
+        return _json({"error": str(e)}), 500
+
+def _json_rows(sql):
+    """
+    Run a query returning one JSON object per row and join them into an
+    encoded array, fetching the rows in batches from the cursor
+    """
+    batches = []
+    conn = db.engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.arraysize = FETCH_BATCH_SIZE
+        cursor.execute(sql)
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            batches.append(",".join(map(itemgetter(0), rows)))
+        cursor.close()
+    finally:
+        conn.close()
+    return ("[" + ",".join(batches) + "]").encode()
+
+@functools.lru_cache(maxsize=256)
+def _medal_winners_json(country_name):
+    """Return the encoded medal winners, optionally filtered by country"""
+    if country_name is None:
+        return _json_rows(ALL_MEDAL_WINNERS_SQL)
+
+    return _rows_json(_country_rows(MEDAL_WINNERS_BY_COUNTRY, country_name), ATHLETE_KEYS)
+
 @app.route("/api/all-medal-winners")
 @app.route("/api/all-medal-winners/<country_name>")
 def entire_data_dump(country_name=None):
@@ -171,44 +323,16 @@ def entire_data_dump(country_name=None):
     Returns:
     JSON: List of dictionaries containing medal data
     """
-    try:
-        query = db.session.query(
-            Athletes.Year,
-            Athletes.Country,
-            Athletes.Athletes,
-            Athletes.Sports,
-            Athletes.Events,
-            Athletes.Gold,
-            Athletes.Silver,
-            Athletes.Bronze,
-            Athletes.Medals
-        ).filter(Athletes.Medals > 0)
-        
-        if country_name is not None:
-            query = query.filter(Athletes.Country.ilike(f'%{country_name}%'))
-    
-        query = query.order_by(Athletes.Year, Athletes.Country)
-        
-        all_athletes = []
-
-        for year, country, athletes, sports, events, gold, silver, bronze, medals in query.all():
-            athlete_dict = {
-                "year": year,
-                "country": country,
-                "athletes": athletes,
-                "sports": sports,
-                "events": events,
-                "gold": gold,
-                "silver": silver,
-                "bronze": bronze,
-                "medals": medals
-            }
-            all_athletes.append(athlete_dict)
-
-        return jsonify(all_athletes)
-    except Exception as e:
-        logger.error(f"Error in all-medal-winners API: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+    if country_name is not None:
+        country_name = country_name.strip().lower()
+    return _api_response("all-medal-winners", _medal_winners_json, country_name)
+
+@functools.lru_cache(maxsize=256)
+def _medal_tally_json(selected_year):
+    """Return the encoded medal tally for the selected year"""
+    query = ATHLETE_MEDALS_SELECT.where(Athletes.Year == selected_year)\
+        .order_by(desc(Athletes.Medals))
+    return _rows_json(db.session.execute(query), MEDAL_KEYS)
 
 @app.route("/api/medals-tally/<int:selected_year>")
 def total_medal_tally(selected_year):
@@ -221,34 +345,12 @@ def total_medal_tally(selected_year):
     Returns:
     JSON: List of dictionaries containing medal data for the selected year
     """
-    try:
-        query = db.session.query(
-            Athletes.Year,
-            Athletes.Country,
-            Athletes.Gold,
-            Athletes.Silver,
-            Athletes.Bronze,
-            Athletes.Medals
-        ).filter(Athletes.Year == selected_year)\
-        .order_by(desc(Athletes.Medals))
-
-        all_medals = []
+    return _api_response("medals-tally", _medal_tally_json, selected_year)
 
-        for year, country, gold, silver, bronze, total_medals in query.all():
-            country_dict = {
-                "year": year,
-                "country": country,
-                "gold": gold,
-                "silver": silver,
-                "bronze": bronze,
-                "total_medals": total_medals
-            }
-            all_medals.append(country_dict)
-
-        return jsonify(all_medals)
-    except Exception as e:
-        logger.error(f"Error in medals-tally API: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+@functools.lru_cache(maxsize=1)
+def _total_medals_json():
+    """Return the encoded medal totals for Olympics held after 1980"""
+    return _json_rows(TOTAL_MEDALS_SQL)
 
 @app.route("/api/total-medals")
 def total_medals():
@@ -258,28 +360,13 @@ def total_medals():
     Returns:
     JSON: List of dictionaries containing medal data after 1980
     """
-    try:
-        query = db.session.query(
-            Athletes.Year,
-            Athletes.Country,
-            Athletes.Medals
-        ).filter(Athletes.Year >= 1980)\
-        .order_by(Athletes.Year, desc(Athletes.Medals))
-        
-        all_country_medals = []
-
-        for year, country, totalmedals in query.all():
-            country_medals = {
-                "year": year,
-                "country": country,
-                "total_medals": totalmedals
-            }
-            all_country_medals.append(country_medals)
-
-        return jsonify(all_country_medals)
-    except Exception as e:
-        logger.error(f"Error in total-medals API: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+    return _api_response("total-medals", _total_medals_json)
+
+def _host_countries_json():
+    """Return the encoded medal counts for host countries"""
+    query = ATHLETE_MEDALS_SELECT.where(Athletes.Host == 1)\
+        .order_by(Athletes.Year)
+    return _rows_json(db.session.execute(query), MEDAL_KEYS)
 
 @app.route("/api/host-countries")
 def host_countries():
@@ -289,35 +376,12 @@ def host_countries():
     Returns:
     JSON: List of dictionaries containing medal data for host countries
     """
-    try:
-        query = db.session.query(
-            Athletes.Year,
-            Athletes.Country,
-            Athletes.Host,
-            Athletes.Gold,
-            Athletes.Silver,
-            Athletes.Bronze,
-            Athletes.Medals
-        ).filter(Athletes.Host == 1)\
-        .order_by(Athletes.Year)
-
-        hosts = []
+    return _json_bytes(HOST_COUNTRIES_JSON)
 
-        for year, country, host, gold, silver, bronze, medals in query.all():
-            host_dict = {
-                "year": year,
-                "country": country,
-                "gold": gold,
-                "silver": silver,
-                "bronze": bronze,
-                "total_medals": medals
-            }
-            hosts.append(host_dict)
-
-        return jsonify(hosts)
-    except Exception as e:
-        logger.error(f"Error in host-countries API: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+@functools.lru_cache(maxsize=256)
+def _country_medals_json(selected_country):
+    """Return the encoded medals won by the selected country"""
+    return _rows_json(_country_rows(COUNTRY_MEDALS_BY_COUNTRY, selected_country), MEDAL_KEYS)
 
 @app.route("/api/country/<selected_country>")
 def country_medals(selected_country):
@@ -330,34 +394,14 @@ def country_medals(selected_country):
     Returns:
     JSON: List of dictionaries containing medal data for the selected country
     """
-    try:
-        query = db.session.query(
-            Athletes.Year,
-            Athletes.Country,
-            Athletes.Gold,
-            Athletes.Silver,
-            Athletes.Bronze,
-            Athletes.Medals
-        ).filter(Athletes.Country.ilike(f'%{selected_country}%'))\
-        .order_by(Athletes.Year)
+    return _api_response("country medals", _country_medals_json, selected_country.strip().lower())
 
-        country_data = []
-
-        for year, country, gold, silver, bronze, medals in query.all():
-            country_dict = {
-                "year": year,
-                "country": country,
-                "gold": gold,
-                "silver": silver,
-                "bronze": bronze,
-                "total_medals": medals
-            }
-            country_data.append(country_dict)
-
-        return jsonify(country_data)
-    except Exception as e:
-        logger.error(f"Error in country medals API: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+@functools.lru_cache(maxsize=1)
+def _medal_tally_after_1960_json():
+    """Return the encoded medal tally for Olympics held after 1960"""
+    query = ATHLETE_MEDALS_SELECT.where(Athletes.Year >= 1960)\
+        .order_by(Athletes.Year, desc(Athletes.Medals))
+    return _rows_json(db.session.execute(query), MEDAL_KEYS_AFTER_1960)
 
 @app.route("/api/medals-tally/years_after_1960")
 def total_medal_tally_year_after_1960():
@@ -367,34 +411,13 @@ def total_medal_tally_year_after_1960():
     Returns:
     JSON: List of dictionaries containing medal data after 1960
     """
-    try:
-        query = db.session.query(
-            Athletes.Year,
-            Athletes.Country,
-            Athletes.Gold,
-            Athletes.Silver,
-            Athletes.Bronze,
-            Athletes.Medals
-        ).filter(Athletes.Year >= 1960)\
-        .order_by(Athletes.Year, desc(Athletes.Medals))
-
-        all_medals = []
-
-        for year, country, gold, silver, bronze, total_medals in query.all():
-            country_dict = {
-                "Year": year,
-                "Nation": country,
-                "Gold": gold,
-                "Silver": silver,
-                "Bronze": bronze,
-                "Medals": total_medals
-            }
-            all_medals.append(country_dict)
+    return _api_response("medals-tally-years-after-1960", _medal_tally_after_1960_json)
 
-        return jsonify(all_medals)
-    except Exception as e:
-        logger.error(f"Error in medals-tally-years-after-1960 API: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+def _countries_json():
+    """Return the encoded list of countries"""
+    with db.engine.connect() as conn:
+        rows = conn.exec_driver_sql("SELECT DISTINCT Country FROM athletes ORDER BY Country").fetchall()
+    return orjson.dumps([row[0] for row in rows])
 
 @app.route("/api/countries")
 def get_countries():
@@ -404,13 +427,13 @@ def get_countries():
     Returns:
     JSON: List of country names
     """
-    try:
-        query = db.session.query(distinct(Athletes.Country)).order_by(Athletes.Country)
-        countries = [country[0] for country in query.all()]
-        return jsonify(countries)
-    except Exception as e:
-        logger.error(f"Error in countries API: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+    return _json_bytes(COUNTRIES_JSON)
+
+def _years_json():
+    """Return the encoded list of Olympic years"""
+    with db.engine.connect() as conn:
+        rows = conn.exec_driver_sql("SELECT DISTINCT Year FROM athletes ORDER BY Year").fetchall()
+    return orjson.dumps([row[0] for row in rows])
 
 @app.route("/api/years")
 def get_years():
@@ -420,13 +443,44 @@ def get_years():
     Returns:
     JSON: List of years
     """
-    try:
-        query = db.session.query(distinct(Athletes.Year)).order_by(Athletes.Year)
-        years = [year[0] for year in query.all()]
-        return jsonify(years)
-    except Exception as e:
-        logger.error(f"Error in years API: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+    return _json_bytes(YEARS_JSON)
+
+# These payloads take no parameters, so encode them once at startup and serve
+# the bytes from memory
+with app.app_context():
+    HOST_COUNTRIES_JSON = _host_countries_json()
+    COUNTRIES_JSON = _countries_json()
+    YEARS_JSON = _years_json()
+
+STATIC_API_DIR = os.path.join(app.static_folder, "api")
+STATIC_PAYLOADS = {
+    "host-countries.json": HOST_COUNTRIES_JSON,
+    "countries.json": COUNTRIES_JSON,
+    "years.json": YEARS_JSON
+}
+
+@app.cli.command("export-static")
+def export_static_payloads():
+    """
+    Write the parameterless payloads into static/api/ for a front-end
+    server such as nginx to serve directly
+
+    Run explicitly with: flask --app app2 export-static
+    """
+    os.makedirs(STATIC_API_DIR, exist_ok=True)
+    for filename, body in STATIC_PAYLOADS.items():
+        path = os.path.join(STATIC_API_DIR, filename)
+        # Write to a temporary file first so a server reading the directory
+        # never sees a partially written payload
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    logger.info(f"Wrote {len(STATIC_PAYLOADS)} payloads to {STATIC_API_DIR}")
 
 # Error handlers
 
@@ -441,4 +495,8 @@ def get_years():
 #     return render_template('500.html'), 500
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=8080)
\ No newline at end of file
+    if DEV_MODE:
+        app.run(debug=True, host='0.0.0.0', port=8080)
+    else:
+        logger.error("Set DEV=1 to use the development server, or run: "
+                     "gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:8080 app2:app")
\ No newline at end of file
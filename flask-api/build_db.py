@@ -0,0 +1,154 @@
+"""
+Build the SQLite database used by app2.py from the CSV files in
+"CSV for ml models/" at the repository root
+
+Run once before starting the app:
+    python build_db.py
+"""
+import os
+import sqlite3
+import logging
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Paths are relative to this file, matching DB_PATH in app2.py; the CSVs live
+# in the tracked "CSV for ml models" directory at the repository root
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(BASE_DIR, "olympics.db")
+DATA_DIR = os.path.join(BASE_DIR, os.pardir, "CSV for ml models")
+
+# WAL is persisted in the database file, so app2.py's connections inherit it
+BUILD_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY"
+)
+
+# Column types for the CSV files, so pandas can skip type inference
+HOST_COUNTRY_DTYPES = {
+    "Year": "int16",
+    "Host_City": "str",
+    "Total Countries": "int16",
+    "Total Sports": "int16",
+    "Total Events": "int16",
+    "Host_Country": "str"
+}
+SUMMER_OLYMPICS_HOST_DTYPES = {
+    "Year": "int16",
+    "Country": "str",
+    "Total_Medals": "int16",
+    "Gold": "int16",
+    "Silver": "int16",
+    "Bronze": "int16",
+    "Athletes": "int16",
+    "Event": "int16",
+    "Sport": "int16",
+    "Host": "int16"
+}
+ATHLETES_DTYPES = {
+    "Year": "int16",
+    "Country": "str",
+    "Host": "int16",
+    "Athletes": "int16",
+    "Sports": "int16",
+    "Events": "int16",
+    "Gold": "int16",
+    "Silver": "int16",
+    "Bronze": "int16",
+    "Medals": "int16"
+}
+
+# SQLite column types for the pandas dtypes above
+SQL_TYPES = {"int16": "SMALLINT", "str": "TEXT"}
+
+def sql_dtypes(dtypes):
+    """Map a pandas dtype dict to SQLite column types"""
+    return {column: SQL_TYPES[dtype] for column, dtype in dtypes.items()}
+
+# Rows read from a CSV file at a time while loading it into SQLite
+CSV_CHUNKSIZE = 50000
+
+def load_csv(conn, path, table, dtypes):
+    """
+    Stream a CSV file into a freshly created SQLite table one chunk at a
+    time, so only a single chunk is ever held in memory
+    """
+    columns = list(dtypes)
+    column_defs = ", ".join(f'"{column}" {sql_type}' for column, sql_type in sql_dtypes(dtypes).items())
+    column_names = ", ".join(f'"{column}"' for column in columns)
+    placeholders = ", ".join("?" for _ in columns)
+    
+    conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+    conn.execute(f'CREATE TABLE "{table}" ({column_defs})')
+    insert = f'INSERT INTO "{table}" ({column_names}) VALUES ({placeholders})'
+    # usecols makes the loaded columns explicit and fails loudly if the CSV
+    # lacks one; selecting them again puts each chunk in the INSERT's order
+    for chunk in pd.read_csv(path, usecols=columns, dtype=dtypes, engine="c", chunksize=CSV_CHUNKSIZE):
+        conn.executemany(insert, chunk[columns].itertuples(index=False, name=None))
+
+def remove_db_files(path):
+    """Delete a SQLite database file along with any journal/WAL side files"""
+    for suffix in ("", "-journal", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+# Create the database and tables if they don't exist
+def create_db_from_csv():
+    """
+    Create SQLite database from CSV files if it doesn't exist
+
+    The database is built in a temporary file that only replaces DB_PATH
+    once everything has been committed, so a failed build never leaves a
+    half-built olympics.db behind.
+    """
+    # Check if database already exists
+    if os.path.exists(DB_PATH):
+        logger.info("Database already exists, skipping creation")
+        return
+    
+    tmp_path = DB_PATH + ".tmp"
+    # Clear out anything left by an interrupted build
+    remove_db_files(tmp_path)
+    
+    conn = None
+    try:
+        # Create connection to the temporary SQLite database
+        conn = sqlite3.connect(tmp_path)
+        for pragma in BUILD_PRAGMAS:
+            conn.execute(pragma)
+        
+        # Build everything in a single transaction so SQLite only syncs once
+        conn.execute("BEGIN")
+        
+        # Stream CSV files into SQLite tables
+        logger.info("Loading CSV files into database tables...")
+        load_csv(conn, os.path.join(DATA_DIR, "host_country.csv"), 'host_country', HOST_COUNTRY_DTYPES)
+        load_csv(conn, os.path.join(DATA_DIR, "Summer_Olympics_Host.csv"), 'summer_olympics_host', SUMMER_OLYMPICS_HOST_DTYPES)
+        load_csv(conn, os.path.join(DATA_DIR, "summer_athlete_medals_count.csv"), 'athletes', ATHLETES_DTYPES)
+        
+        # Index the columns the API filters and sorts on
+        logger.info("Creating indexes...")
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_ath_year_medals ON athletes(Year, Medals DESC)")
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_ath_country ON athletes(Country COLLATE NOCASE)")
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_ath_host ON athletes(Host) WHERE Host = 1")
+        conn.execute("ANALYZE")
+        conn.commit()
+        
+        # Closing the last connection checkpoints the WAL back into the file
+        conn.close()
+        conn = None
+        os.replace(tmp_path, DB_PATH)
+        logger.info("Database created successfully from CSV files")
+    except Exception as e:
+        logger.error(f"Error creating database: {str(e)}")
+        raise
+    finally:
+        if conn is not None:
+            conn.close()
+        remove_db_files(tmp_path)
+
+if __name__ == '__main__':
+    create_db_from_csv()